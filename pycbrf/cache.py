@@ -0,0 +1,88 @@
+"""Optional on-disk cache for raw Bank of Russia responses.
+
+Caching is off by default. To turn it on set PYCBRF_CACHE_DIR environment variable
+to a directory path: responses will be kept there in an SQLite database
+shared by all processes.
+
+"""
+import os
+import time
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Optional
+
+LOG = getLogger(__name__)
+
+ENV_CACHE_DIR = 'PYCBRF_CACHE_DIR'
+"""Environment variable with a directory for the cache."""
+
+_lock = Lock()
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Returns cache directory if caching is enabled."""
+    path = os.environ.get(ENV_CACHE_DIR)
+
+    if not path:
+        return None
+
+    return Path(path)
+
+
+@lru_cache(maxsize=None)
+def _get_connection(path: Path) -> 'sqlite3.Connection':
+    """Returns a connection to the cache database in the given directory.
+    Connections are reused within the process.
+
+    :param path:
+
+    """
+    import sqlite3  # Imported only when caching is enabled.
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(str(path / 'pycbrf.sqlite3'), check_same_thread=False)
+
+    with connection:
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB, fetched_at INTEGER)')
+
+    return connection
+
+
+def get_or_fetch(key: str, fetch: Callable[[], bytes], *, ttl: Optional[int] = None) -> bytes:
+    """Returns cached data for the key. Fetches and caches data if there's none or it is stale.
+
+    If caching is disabled (see PYCBRF_CACHE_DIR) just fetches.
+
+    :param key: Cache key.
+    :param fetch: Function to get data for the key.
+    :param ttl: Seconds for data to be considered fresh. None - never expires.
+
+    """
+    cache_dir = get_cache_dir()
+
+    if cache_dir is None:
+        return fetch()
+
+    connection = _get_connection(cache_dir)
+    now = int(time.time())
+
+    with _lock:
+        cached = connection.execute('SELECT body, fetched_at FROM responses WHERE key = ?', (key,)).fetchone()
+
+    if cached:
+        body, fetched_at = cached
+
+        if ttl is None or now - fetched_at < ttl:
+            LOG.debug(f'Cache hit for {key}')
+            return body
+
+    body = fetch()
+
+    with _lock, connection:
+        connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?)', (key, body, now))
+
+    return body
@@ -21,3 +21,10 @@ class ExchangeRateNotFound(PycbrfException, KeyError):
 
     def __init__(self, message=None):
         self.message = message or 'There is no such ExchangeRate within ExchangeRates.'
+
+
+class WrongResponse(PycbrfException):
+    """The exception is raised if Bank of Russia returned data that can not be parsed"""
+
+    def __init__(self, message=None):
+        self.message = message or 'Unexpected response from Bank of Russia.'
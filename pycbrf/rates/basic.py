@@ -1,16 +1,37 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Context, Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
 from logging import getLogger
-from typing import Dict, NamedTuple, Optional, Union
-from xml.etree import ElementTree
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 
-from .constants import URL_BASE
+from .constants import URL_BASE, DECIMAL_COMMA
 from .currencies import Currency, CURRENCIES
 from ..exceptions import CurrencyNotFound, ExchangeRateNotFound, WrongArguments
-from ..utils import FormatMixin, WithRequests, TypeDateDef
+from ..utils import FormatMixin, WithRequests, TypeDateDef, TypeXmlSource, iter_xml, ElementTree, CACHE_TTL_RECENT
 
 LOG = getLogger(__name__)
 
+RATE_CONTEXT = Context(prec=12, rounding=ROUND_HALF_EVEN)
+"""Decimal context for rate calculation.
+Bank of Russia publishes values with four decimal places, so 12 significant digits are plenty.
+
+"""
+
+
+@lru_cache(maxsize=16)
+def parse_nominal(value: str) -> Decimal:
+    """Returns Decimal for a rate nominal string.
+
+    Nominals are a handful of values (1, 10, 100, ...) so they are parsed once.
+    Note that nominal from a rate may differ from the one of its currency.
+
+    :param value:
+
+    """
+    return Decimal(value)
+
 
 class ExchangeRate(NamedTuple):
     """Represents exchange rate for the currency on the date."""
@@ -43,7 +64,10 @@ class ExchangeRate(NamedTuple):
     """Rate nominal."""
 
     rate: Decimal
-    """Rate ration (rate = value / par)."""
+    """Rate ration (rate = value / par).
+    Calculated with 12 significant digits precision (see RATE_CONTEXT).
+
+    """
 
 
 class ExchangeRates(WithRequests, FormatMixin):
@@ -99,6 +123,30 @@ class ExchangeRates(WithRequests, FormatMixin):
         self.dates_match: bool = (self.date_requested == self.date_received)
         """Flag. True if the actual date equals the requested."""
 
+    @classmethod
+    def fetch_many(
+            cls,
+            dates: Iterable[TypeDateDef],
+            *,
+            locale_en: bool = False,
+            max_workers: int = 8,
+    ) -> Dict[datetime, 'ExchangeRates']:
+        """Fetches exchange rates for several dates concurrently.
+
+        .. code-block::
+
+            rates = ExchangeRates.fetch_many(['2021-08-23', '2021-08-24'])
+            rates[datetime(2021, 8, 24)]['USD'].value
+
+        :param dates: Dates to get rates for (see ExchangeRates for supported values).
+        :param locale_en: See ExchangeRates.
+        :param max_workers: Maximum number of concurrent requests (see WithRequests).
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(cls, on_date, locale_en=locale_en) for on_date in dates]
+            return {rates.date_requested: rates for rates in (future.result() for future in futures)}
+
     def __getitem__(self, item: Union[str, int, Currency]) -> Optional[ExchangeRate]:
         """Implement dictionary lookup
 
@@ -116,60 +164,87 @@ class ExchangeRates(WithRequests, FormatMixin):
             return None  # return None, not an exception, is made for backward compatibility.
 
     @classmethod
-    def _parse(cls, data: bytes, *, locale_en: bool) -> Dict[str, Union[datetime, Dict[Currency, ExchangeRate]]]:
-        """Parse raw XML strings to the dict of BetaExchangeRates"""
+    def _parse(
+            cls,
+            data: TypeXmlSource,
+            *,
+            locale_en: bool
+    ) -> Dict[str, Union[datetime, Dict[Currency, ExchangeRate]]]:
+        """Parse raw XML strings (or a streamed response) to the dict of BetaExchangeRates"""
         LOG.debug('Parsing data ...')
 
-        xml = ElementTree.fromstring(data)
-        meta = xml.attrib
+        elements = iter_xml(data, 'Valute')
+        meta = next(elements).attrib
+
+        date_received = cls._date_parse(meta['Date'])
 
         result = {
-            'date': cls._date_parse(meta['Date']),
-            'rates': {},
+            'date': date_received,
+            'rates': dict(cls._iter_rates(elements, date_received, locale_en=locale_en)),
         }
 
-        for currency in xml:
-            props = {}
-            for prop in currency:
-                props[prop.tag] = prop.text
+        LOG.debug(f"Parsed: {len(result['rates'])} currencies")
+
+        return result
+
+    @classmethod
+    def _iter_rates(
+            cls,
+            elements: Iterable[ElementTree.Element],
+            on_date: datetime,
+            *,
+            locale_en: bool
+    ) -> Iterator[Tuple[Currency, ExchangeRate]]:
+        """Yields (currency, rate) pairs from the parsed XML.
+
+        :param elements: Valute elements.
+        :param on_date: Date of the rates.
+        :param locale_en: Flag to get currency names in English.
+
+        """
+        get_name = attrgetter('name_eng' if locale_en else 'name_ru')
+        get_par = parse_nominal
+        get_currency = CURRENCIES.__getitem__
+        make_rate = ExchangeRate
+        to_decimal = Decimal
+        divide = RATE_CONTEXT.divide
+
+        for currency in elements:
+            props = {prop.tag: prop.text for prop in currency}
 
-            par = Decimal(props['Nominal'])
-            par_value = Decimal(props['Value'].replace(',', '.'))
+            currency_id = currency.attrib['ID']
+            par = get_par(props['Nominal'])
+            par_value = to_decimal(props['Value'].translate(DECIMAL_COMMA))
 
             try:
-                currency = CURRENCIES[currency.attrib['ID']]
+                currency = get_currency(currency_id)
             except CurrencyNotFound:
                 # The request for old information may contain a currency
                 # that has already been removed from the Currencies.
                 # In this case, add a new currency to Currencies.
                 currency = Currency(
-                    id=currency.attrib['ID'],
+                    id=currency_id,
                     name_eng=props['Name'],
                     name_ru=props['Name'],
                     code=props['CharCode'],
                     num=props['NumCode'],
-                    par=Decimal(props['Nominal']),
+                    par=par,
                 )
                 CURRENCIES.register(currency)
 
-            name = currency.name_eng if locale_en else currency.name_ru
-
-            result['rates'][currency] = ExchangeRate(
-                date=result['date'],
+            yield currency, make_rate(
+                date=on_date,
                 currency=currency,
-                name=name,
+                name=get_name(currency),
                 value=par_value,
                 par=par,
-                rate=par_value / par,
+                # Most of the rates are given per one unit, no need to divide.
+                rate=par_value if par == 1 else divide(par_value, par),
             )
 
-        LOG.debug(f"Parsed: {len(result['rates'])} currencies")
-
-        return result
-
     @classmethod
-    def _get_data(cls, on_date: datetime, *, locale_en: bool) -> bytes:
-        """Prepares parameters for the link and returns raw XML"""
+    def _get_data(cls, on_date: datetime, *, locale_en: bool) -> TypeXmlSource:
+        """Prepares parameters for the link and returns a streamed response with XML (or XML if cached)"""
         url = f"{URL_BASE}XML_daily{'_eng' if locale_en else ''}.asp"
 
         params = {
@@ -178,10 +253,15 @@ class ExchangeRates(WithRequests, FormatMixin):
 
         LOG.debug(f'Getting exchange rates from {url} ...')
 
-        response = cls._get_response(url=url, params=params)
-        data = response.content
-
-        return data
+        return cls._get_cached(
+            url,
+            params=params,
+            stream=True,
+            cache_key=f"daily:{locale_en:d}:{on_date:%Y%m%d}",
+            root_tag='ValCurs',
+            # Past rates never change.
+            cache_ttl=None if on_date.date() < date.today() else CACHE_TTL_RECENT,
+        )
 
     def __str__(self):
         return f"ExchangeRates of {len(self.rates)} currencies from {self.date_requested}"
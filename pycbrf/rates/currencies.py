@@ -1,17 +1,37 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache, partial
+from hashlib import sha1
 from logging import getLogger
+from pathlib import Path
+from threading import Lock
 from typing import Dict, NamedTuple, Tuple, Union, Optional
 from xml.etree import ElementTree
 
 from .constants import URL_BASE, DAILY_CURRENCIES, MONTHLY_CURRENCIES
 from ..exceptions import CurrencyNotFound
-from ..utils import SingletonMeta, FormatMixin, WithRequests
+from ..utils import SingletonMeta, FormatMixin, WithRequests, CACHE_TTL_RECENT
 
 LOG = getLogger(__name__)
 
 TypeCurrencyIndex = Dict[str, 'Currency']
 
+PATH_PREBUILT_INDEX = Path(__file__).with_name('_currencies.pkl')
+"""Currencies index for bundled data prebuilt by scripts/build_currency_index.py."""
+
+PREBUILT_INDEX_PROTOCOL = 4
+"""Pickle protocol for the prebuilt index. The highest one supported by Python 3.6."""
+
+
+def get_bundled_digest() -> str:
+    """Returns a digest of currencies data bundled with the package.
+    Used to tell whether the prebuilt index is up to date.
+
+    """
+    return sha1(DAILY_CURRENCIES + MONTHLY_CURRENCIES).hexdigest()
+
 
 class Currency(NamedTuple):
     """Represents a foreign currency.
@@ -47,10 +67,19 @@ class Currency(NamedTuple):
     """Nominal exchange rate."""
 
     def __hash__(self):
-        return hash((self.id, self.num, self.code))
+        # Equal currencies always share id, so hashing it alone is enough
+        # and spares a tuple allocation (string hashes are cached by Python).
+        return hash(self.id)
 
     def __eq__(self, obj):
-        return isinstance(obj, type(self)) and (obj.id, obj.num, obj.code) == (self.id, self.num, self.code)
+        if obj is self:
+            return True  # Currencies are mostly shared from the registry, so this is the common case.
+
+        # Compare id first: it differs for distinct currencies, no need to look further.
+        return (
+            isinstance(obj, type(self)) and
+            obj.id == self.id and obj.num == self.num and obj.code == self.code
+        )
 
 
 class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
@@ -60,28 +89,87 @@ class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
         self.updated: Optional[datetime] = None
         """Date of loading the latest information from www.cbr.ru"""
 
-        self.currencies: TypeCurrencyIndex = self._parse((DAILY_CURRENCIES, MONTHLY_CURRENCIES))
-        """Known currencies."""
+        self._currencies: Optional[TypeCurrencyIndex] = None
+        self._currencies_lock = Lock()
+
+    @property
+    def currencies(self) -> TypeCurrencyIndex:
+        """Known currencies.
+
+        Bundled data is parsed on first access, so that importing the package stays cheap.
+
+        """
+        currencies = self._currencies
+
+        if currencies is None:
+            with self._currencies_lock:
+                currencies = self._currencies
+
+                if currencies is None:
+                    currencies = self._currencies = self._load_bundled()
+
+        return currencies
+
+    @currencies.setter
+    def currencies(self, value: TypeCurrencyIndex):
+        self._currencies = value
+
+    def dump_bundled(self, path: Path = PATH_PREBUILT_INDEX):
+        """Writes prebuilt index for currencies data bundled with the package.
+
+        :param path:
+
+        """
+        currencies = self._parse((DAILY_CURRENCIES, MONTHLY_CURRENCIES))
+        path.write_bytes(pickle.dumps((get_bundled_digest(), currencies), protocol=PREBUILT_INDEX_PROTOCOL))
+
+    def _load_bundled(self) -> TypeCurrencyIndex:
+        """Returns currencies index for the data bundled with the package.
+
+        Unpickling the prebuilt index is way faster than parsing XML,
+        so XML is parsed only if the index is missing or outdated.
+
+        """
+        try:
+            digest, currencies = pickle.loads(PATH_PREBUILT_INDEX.read_bytes())
+
+            if digest == get_bundled_digest():
+                return currencies
+
+            LOG.debug('Prebuilt currencies index is outdated')
+
+        except Exception as e:
+            LOG.debug(f'Prebuilt currencies index is unavailable: {e}')
+
+        return self._parse((DAILY_CURRENCIES, MONTHLY_CURRENCIES))
 
     def __getitem__(self, value: Union[int, str]) -> Currency:
         """Returns Currency by dictionary lookup, converting the argument to ISO format."""
         if not value:
             raise CurrencyNotFound(f'Currency "{value}" not found.')
 
-        item = self._format_num_code(value)
-        item = item.lower()
+        currencies = self.currencies
 
         try:
-            currency = self.currencies[item]
-        except KeyError:
+            currency = currencies.get(value)
+        except TypeError:  # Unhashable.
             raise CurrencyNotFound()
 
+        if currency is None:
+            try:
+                currency = currencies[self._normalize_key(value)]
+            except KeyError:
+                raise CurrencyNotFound()
+
         return currency
 
     def update(self):
-        """Get and parse actual data from the www.cbr.ru."""
-        raw_data = self._get_data()
-        self.currencies.update(self._parse(raw_data))
+        """Get and parse actual data from the www.cbr.ru.
+
+        Responses may be cached on disk (see pycbrf.cache).
+
+        """
+        self.currencies.update(self._parse(self._get_data()))
         self.updated = datetime.now()
 
     def register(self, currency: Currency):
@@ -90,7 +178,19 @@ class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
         :param currency:
 
         """
-        self.currencies.update(self._index_currency(currency))
+        self._index_currency(currency, self.currencies)
+
+    @staticmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def _normalize_key(value: Union[int, str]) -> str:
+        """Converts a lookup value into the currencies index key.
+
+        Results are cached since the same handful of keys are usually looked up over and over.
+
+        :param value:
+
+        """
+        return FormatMixin._format_num_code(value).lower()
 
     @classmethod
     def _get_data(cls) -> Tuple[bytes, bytes]:
@@ -99,28 +199,49 @@ class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
 
         LOG.debug(f'Getting update currencies from {url} ...')
 
-        daily_update_response = cls._get_response(url)
-        daily_update_data = daily_update_response.content
+        # Both lists are independent, so fetch them simultaneously.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            get = partial(cls._get_cached, url, cache_ttl=CACHE_TTL_RECENT, root_tag='Valuta')
+
+            daily_update = executor.submit(get, cache_key='currencies:daily')
+            monthly_update = executor.submit(get, params={'d': 1}, cache_key='currencies:monthly')
 
-        monthly_update_response = cls._get_response(url, params={'d': 1})
-        monthly_update_data = monthly_update_response.content
+            daily_update_data = daily_update.result()
+            monthly_update_data = monthly_update.result()
 
         return daily_update_data, monthly_update_data
 
     @staticmethod
-    def _index_currency(currency: Currency) -> TypeCurrencyIndex:
-        """Creates a dict of three elements from the currency with the keys: id, code and num if they exists"""
-        pack = {currency.id.lower(): currency}
+    def _index_currency(currency: Currency, currencies: TypeCurrencyIndex):
+        """Puts the currency into the currencies index under the keys: id, code and num if they exists.
+
+        Besides normalized keys (see ._normalize_key()) the index also gets keys as they come
+        from the Bank of Russia (e.g. 'R01010', 'AUD', '36'), so that most lookups
+        do not require normalization.
+
+        The index is updated in place to spare creating and merging an intermediate dict per currency.
+
+        :param currency:
+        :param currencies: Index to update.
+
+        """
+        id_, code, num = currency.id, currency.code, currency.num
+
+        currencies[id_] = currency
+        currencies[id_.lower()] = currency
 
         # Data from the Bank of Russia contains replaced currencies that do not have ISO attributes.
         # So additional If-statements were added to exclude None from the 'codes'.
-        if currency.code:
-            pack[currency.code.lower()] = currency
+        if code:
+            currencies[code] = currency
+            currencies[code.lower()] = currency
 
-        if currency.num:
-            pack[currency.num] = currency
+        if num:
+            currencies[num] = currency
 
-        return pack
+            num_short = num.lstrip('0')
+            if num_short:
+                currencies[num_short] = currency
 
     def _parse(self, data: Tuple[bytes, bytes]) -> TypeCurrencyIndex:
         """Parse XML bytes strings from www.cbr.ru to dict of Currencies."""
@@ -133,12 +254,11 @@ class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
         format_num = self._format_num_code
 
         for sub_data in data:
+            # Lists are short and always at hand as bytes, so there is no point in streaming.
             root = ElementTree.fromstring(sub_data)
 
             for child in root:
-                props = {}
-                for prop in child:
-                    props[prop.tag] = prop.text
+                props = {prop.tag: prop.text for prop in child}
 
                 num = props['ISO_Num_Code'] or None
                 if num:
@@ -157,7 +277,7 @@ class Currencies(WithRequests, FormatMixin, metaclass=SingletonMeta):
                 )
 
                 counter += 1
-                currencies.update(index(currency))
+                index(currency, currencies)
 
         LOG.debug(f"Parsed: {counter} currencies")
         return currencies
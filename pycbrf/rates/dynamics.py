@@ -1,14 +1,14 @@
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from logging import getLogger
-from typing import Dict, Tuple, Union
-from xml.etree import ElementTree
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
 
-from .constants import URL_BASE
+from .constants import URL_BASE, DECIMAL_COMMA
 from .currencies import Currency, CURRENCIES
-from ..exceptions import ExchangeRateNotFound, WrongArguments
-from .basic import ExchangeRate
-from ..utils import FormatMixin, WithRequests, TypeDateDef
+from ..exceptions import ExchangeRateNotFound, WrongArguments, WrongResponse
+from .basic import ExchangeRate, RATE_CONTEXT, parse_nominal
+from ..utils import FormatMixin, WithRequests, TypeDateDef, TypeXmlSource, iter_xml, ElementTree, CACHE_TTL_RECENT
 
 LOG = getLogger(__name__)
 
@@ -31,6 +31,9 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
             rates = ExchangeRateDynamics('2021-08-01', date(2021, 8, 24), currency='840')
             rates = ExchangeRateDynamics(since='2021-08-24', currency=840)
 
+            # Fetch a long period in yearly chunks concurrently:
+            rates = ExchangeRateDynamics('2001-01-01', '2021-08-24', currency='USD', chunk=timedelta(days=365))
+
     Receiving:
         By string: 4217 currency alphabetic code: rates('2021-08-24')
         By Python date: rates(date(2021, 08, 24))
@@ -42,6 +45,9 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
         Exchange rates on such dates will not be available in the ExchangeRatesDynamics.
     """
 
+    chunk_workers: int = 4
+    """Maximum number of period chunks fetched concurrently."""
+
     def __init__(
             self,
             since: TypeDateDef = None,
@@ -49,6 +55,7 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
             *,
             currency: Union[str, int, Currency],
             locale_en: bool = False,
+            chunk: timedelta = None,
     ):
         """
         :param since: Date of the exchange rate or start date of the period for the exchange rate dynamics.
@@ -63,6 +70,10 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
         :param locale_en: Flag to get currency names in English.
             If not set names will be provided in Russian.
 
+        :param chunk: Split periods longer than this into chunks of such length
+            and fetch them concurrently. Must be a whole number of days.
+            If not set the whole period is fetched at once.
+
         .. note:: If all arguments are specified, get the rate dynamics between the passed dates.
             If currency and one date are passed, get the rate of the specified currency at the date.
             If only currency is passed, get the exchange rate for today.
@@ -70,11 +81,65 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
 
         self.since, self.till, self.currency = self._check_and_convert_args(since, till, currency)
 
-        raw_data = self._get_data(self.currency)
-        rates = self._parse(raw_data, self.currency, locale_en=locale_en)
+        if chunk is not None and (chunk < timedelta(days=1) or chunk % timedelta(days=1)):
+            # Rates are given per day, so a partial day would make windows drift and lose dates.
+            raise WrongArguments('Period chunk must be a whole number of days.')
+
+        def get_rates(period: Tuple[datetime, datetime]) -> Dict[datetime, ExchangeRate]:
+            raw_data = self._get_data(self.currency, *period)
+            return self._parse(raw_data, self.currency, locale_en=locale_en)
+
+        periods = self._split_period(chunk)
+
+        if len(periods) == 1:
+            rates = get_rates(periods[0])
+
+        else:
+            rates = {}
+
+            with ThreadPoolExecutor(max_workers=self.chunk_workers) as executor:
+                for chunk_rates in executor.map(get_rates, periods):
+                    rates.update(chunk_rates)
 
         self.rates = rates
 
+    @classmethod
+    def bulk(
+            cls,
+            since: TypeDateDef = None,
+            till: TypeDateDef = None,
+            *,
+            currencies: Iterable[Union[str, int, Currency]],
+            locale_en: bool = False,
+            max_workers: int = 8,
+    ) -> Dict[Currency, 'ExchangeRateDynamics']:
+        """Fetches exchange rate dynamics for several currencies concurrently.
+
+        .. code-block::
+
+            dynamics = ExchangeRateDynamics.bulk('2021-08-01', '2021-08-24', currencies=['USD', 'EUR'])
+            dynamics[Currencies()['USD']]['2021-08-24'].value
+
+        :param since: See ExchangeRateDynamics.
+        :param till: See ExchangeRateDynamics.
+        :param currencies: Currencies to get dynamics for (see ExchangeRateDynamics for supported values).
+        :param locale_en: See ExchangeRateDynamics.
+        :param max_workers: Maximum number of concurrent requests (see WithRequests).
+
+        """
+        # Different aliases of the same currency (e.g. 'USD' and 840) are fetched once.
+        currencies = dict.fromkeys(
+            currency if isinstance(currency, Currency) else CURRENCIES[currency]
+            for currency in currencies
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(cls, since, till, currency=currency, locale_en=locale_en)
+                for currency in currencies
+            ]
+            return {dynamics.currency: dynamics for dynamics in (future.result() for future in futures)}
+
     def __getitem__(self, item: TypeDateDef) -> ExchangeRate:
         """Returns the ExchangeRate by date.
 
@@ -122,54 +187,116 @@ class ExchangeRateDynamics(WithRequests, FormatMixin):
 
         return since, till, currency
 
-    def _get_data(self, currency: Currency) -> bytes:
-        """Prepares parameters for the link and returns raw XML"""
+    def _split_period(self, chunk: timedelta = None) -> List[Tuple[datetime, datetime]]:
+        """Splits the requested period into consecutive (since, till) chunks.
+
+        :param chunk: Chunk length. If not set the whole period is returned as the only chunk.
+
+        """
+        since, till = self.since, self.till
+
+        if chunk is None:
+            return [(since, till)]
+
+        one_day = timedelta(days=1)
+        periods = []
+
+        while since <= till:
+            chunk_till = min(since + chunk - one_day, till)
+            periods.append((since, chunk_till))
+            since = chunk_till + one_day
+
+        return periods
+
+    def _get_data(self, currency: Currency, since: datetime, till: datetime) -> TypeXmlSource:
+        """Prepares parameters for the link and returns a streamed response with XML (or XML if cached)"""
         url = f"{URL_BASE}XML_dynamic.asp"
         format_date = self._date_format
         params = {
-            'date_req1': format_date(self.since),
-            'date_req2': format_date(self.till),
+            'date_req1': format_date(since),
+            'date_req2': format_date(till),
             'VAL_NM_RQ': currency.id,
         }
 
-        response = super()._get_response(url=url, params=params)
-        raw_data = response.content
-
-        return raw_data
+        return self._get_cached(
+            url,
+            params=params,
+            stream=True,
+            cache_key=f'dynamic:{currency.id}:{since:%Y%m%d}:{till:%Y%m%d}',
+            root_tag='ValCurs',
+            # Past rates never change.
+            cache_ttl=None if till.date() < date.today() else CACHE_TTL_RECENT,
+        )
 
     @classmethod
-    def _parse(cls, data: bytes, currency: Currency, *, locale_en: bool = False) -> Dict[datetime, ExchangeRate]:
-        """Parse raw XML strings with rate dynamics to the dict of ExchangeRate"""
+    def _parse(
+            cls,
+            data: TypeXmlSource,
+            currency: Currency,
+            *,
+            locale_en: bool = False
+    ) -> Dict[datetime, ExchangeRate]:
+        """Parse raw XML strings (or a streamed response) with rate dynamics to the dict of ExchangeRate"""
         LOG.debug('Parsing data ...')
 
-        xml = ElementTree.fromstring(data)
+        elements = iter_xml(data, 'Record')
+
+        try:
+            root = next(elements)
+
+            if root.tag != 'ValCurs':
+                raise WrongResponse(f'Unexpected exchange rate dynamics root element: {root.tag}')
+
+            # Empty ValCurs means no rates for the period (e.g. weekends only or currency is not quoted).
+            result = dict(cls._iter_rates(elements, currency, locale_en=locale_en))
 
-        result = {}
+        except ElementTree.ParseError as e:
+            # E.g. plain text error message on bogus request parameters.
+            raise WrongResponse(f'Unable to parse exchange rate dynamics: {e}')
 
+        LOG.debug(f"Parsed: {len(result)} days")
+
+        return result
+
+    @classmethod
+    def _iter_rates(
+            cls,
+            elements: Iterable[ElementTree.Element],
+            currency: Currency,
+            *,
+            locale_en: bool
+    ) -> Iterator[Tuple[datetime, ExchangeRate]]:
+        """Yields (date, rate) pairs from the parsed XML.
+
+        :param elements: Record elements.
+        :param currency: The currency of the rates.
+        :param locale_en: Flag to get currency names in English.
+
+        """
         get_date = cls._date_parse
+        get_par = parse_nominal
+        make_rate = ExchangeRate
+        to_decimal = Decimal
+        divide = RATE_CONTEXT.divide
 
-        for child in xml:
-            params = {}
-            for param in child:
-                params[param.tag] = param.text
+        # The currency is the same for all records.
+        name = currency.name_eng if locale_en else currency.name_ru
 
+        for child in elements:
             date_received = get_date(child.attrib['Date'])
-            par = Decimal(params['Nominal'])
-            value = Decimal(params['Value'].replace(',', '.'))
+            par = get_par(child.findtext('Nominal'))
+            value = to_decimal(child.findtext('Value').translate(DECIMAL_COMMA))
 
-            result[date_received] = ExchangeRate(
+            yield date_received, make_rate(
                 currency=currency,
-                name=currency.name_eng if locale_en else currency.name_ru,
+                name=name,
                 date=date_received,
                 par=par,
                 value=value,
-                rate=value / par,
+                # Most of the rates are given per one unit, no need to divide.
+                rate=value if par == 1 else divide(value, par),
             )
 
-        LOG.debug(f"Parsed: {len(result)} days")
-
-        return result
-
     def __str__(self):
         return f"{self.currency.code} ExchangeRateDynamics from {self.since} to {self.till}"
 
@@ -1,4 +1,4 @@
 # Exposed as API
 from .banks import Banks  # noqa
-from .exceptions import PycbrfException, CurrencyNotFound, WrongArguments, ExchangeRateNotFound  # noqa
+from .exceptions import PycbrfException, CurrencyNotFound, WrongArguments, ExchangeRateNotFound, WrongResponse  # noqa
 from .rates import *  # noqa
@@ -1,13 +1,81 @@
-from datetime import date, datetime
-from typing import Union, Optional
+from datetime import date, datetime, time
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable, Iterator, Union, Optional
+from xml.etree import ElementTree
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+from .cache import get_cache_dir, get_or_fetch
+from .exceptions import WrongResponse
 
 TypeDateDef = Union[str, date, datetime]
 
+TypeXmlSource = Union[bytes, requests.Response]
+
+MIDNIGHT = time()
+
+CACHE_TTL_RECENT = 3600
+"""Seconds to cache data which may still change (e.g. rates for today)."""
+
+
+def get_session() -> requests.Session:
+    """Returns a new HTTP session with connection pooling and retries set up."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1024)
+def parse_iso_date(value: str) -> datetime:
+    """Parses ISO date string ('%Y-%m-%d') into a datetime.
+
+    Results are cached since the same dates are usually used over and over (e.g. to index rate dynamics).
+    Canonical fixed width strings are sliced directly, others are left to strptime().
+
+    :param value:
+
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+@lru_cache(maxsize=8)
+def get_headers(user_agent: str) -> Dict[str, str]:
+    """Returns HTTP headers for requests.
+
+    Headers are built once per user agent (see WithRequests.req_user_agent) and shared:
+    requests merges them into a new dict, so they are never modified.
+
+    :param user_agent:
+
+    """
+    return {
+        'User-Agent': user_agent,
+    }
+
 
 class WithRequests:
-    """Mixin to perform HTTP requests."""
+    """Mixin to perform HTTP requests.
+
+    Requests issued concurrently (e.g. by bulk fetching helpers) share
+    the session and its connections. Keep the number of concurrent requests
+    moderate: the Bank of Russia server may reject too many simultaneous requests.
+
+    """
+
+    req_session: Optional[requests.Session] = None
+    """Session shared by all requests to keep connections to the server alive.
+    Created on first request if not set.
+
+    """
+
+    _session_lock = Lock()
 
     req_timeout: int = 10
 
@@ -16,28 +84,97 @@ class WithRequests:
         'Chrome/74.0.3729.169 YaBrowser/19.6.2.594 (beta) Yowser/2.5 Safari/537.36'
     )
 
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        session = cls.req_session
+
+        if session is None:
+            with cls._session_lock:
+                session = cls.req_session
+
+                if session is None:
+                    # Set on the mixin itself for the session to be shared by all its descendants.
+                    session = WithRequests.req_session = get_session()
+
+        return session
+
+    @classmethod
+    def _get_cached(
+            cls,
+            url: str,
+            *,
+            cache_key: str,
+            cache_ttl: Optional[int] = None,
+            root_tag: str,
+            stream: bool = False,
+            **kwargs
+    ) -> TypeXmlSource:
+        """Returns data from the URL using on-disk cache if it is enabled (see pycbrf.cache).
+
+        With no cache returns a streamed response if `stream` is set, and response contents otherwise.
+        With cache always returns contents.
+
+        :param url:
+        :param cache_key: Key to store data under.
+        :param cache_ttl: Seconds for cached data to be considered fresh. None - never expires.
+        :param root_tag: Root element tag of the expected XML document.
+            Data is cached only if it is such a document.
+        :param stream:
+
+        """
+        if get_cache_dir() is None:
+            response = cls._get_response(url, stream=stream, **kwargs)
+            return response if stream else response.content
+
+        def fetch():
+            response = cls._get_response(url, **kwargs)
+            response.raise_for_status()
+
+            content = response.content
+
+            # Bank of Russia may respond with 200 OK to bogus requests (e.g. a plain text error
+            # or an HTML page), and such responses must not get into cache (possibly forever).
+            try:
+                tag = ElementTree.fromstring(content).tag
+
+            except ElementTree.ParseError as e:
+                raise WrongResponse(f'Unable to parse response from {url}: {e}')
+
+            if tag != root_tag:
+                raise WrongResponse(f'Unexpected root element in response from {url}: {tag}')
+
+            return content
+
+        return get_or_fetch(cache_key, fetch, ttl=cache_ttl)
+
     @classmethod
     def _get_response(cls, url: str, **kwargs) -> requests.Response:
         kwargs_ = {
             'timeout': cls.req_timeout,
-            'headers': {
-                'User-Agent': cls.req_user_agent,
-            },
+            'headers': get_headers(cls.req_user_agent),
         }
         kwargs_.update(kwargs)
 
-        return requests.get(url, **kwargs_)
+        return cls._get_session().get(url, **kwargs_)
 
 
 class SingletonMeta(type):
     """Mixin for create Singleton pattern that restricts the instantiation of a class to one "single" instance"""
     _instances = {}
+    _lock = Lock()
 
     def __call__(cls):
-        if cls not in cls._instances:
-            instance = super().__call__()
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+
+        if instance is None:
+            # Double-checked so that concurrent first calls create just one instance.
+            with cls._lock:
+                instance = cls._instances.get(cls)
+
+                if instance is None:
+                    instance = cls._instances[cls] = super().__call__()
+
+        return instance
 
 
 class FormatMixin:
@@ -47,6 +184,9 @@ class FormatMixin:
     def _format_num_code(num: Union[int, str]) -> str:
         """Format integer or invalid string numeric code to ISO 4217 currency numeric code string."""
 
+        if type(num) is str and len(num) == 3:
+            return num  # Already canonical (e.g. '840'), that's the most common case.
+
         return f'{num}'.zfill(3)
 
     @staticmethod
@@ -60,24 +200,108 @@ class FormatMixin:
 
     @staticmethod
     def _date_parse(value: str) -> datetime:
-        """Parse a string into a datetime.
+        """Parse a string in Bank of Russia '%d.%m.%Y' format into a datetime.
+
+        Fixed width format is sliced directly as strptime() is way slower
+        and this is called for every record of rate dynamics.
 
         :param value:
 
         """
-        return datetime.strptime(value, '%d.%m.%Y')
+        return datetime(int(value[6:10]), int(value[3:5]), int(value[:2]))
 
     @staticmethod
     def _get_datetime(value: TypeDateDef) -> Optional[datetime]:
         """Format date to datetime.datetime from string and datetime.date
 
+        Time of datetime objects is dropped, since rates are given per day.
+
         :param value:
 
         """
+        value_type = type(value)
+
+        # Exact type checks first for the most common arguments.
+        if value_type is str:
+            return parse_iso_date(value)
+
+        if value is None:
+            return value
+
+        if value_type is datetime and not value.tzinfo and value.time() == MIDNIGHT:
+            return value  # Already canonical, e.g. a key from rate dynamics.
+
         if isinstance(value, str):
-            value = datetime.strptime(value, '%Y-%m-%d')
+            value = parse_iso_date(value)
 
         elif isinstance(value, date):
             value = datetime(value.year, value.month, value.day)
 
         return value
+
+
+def iter_xml(source: TypeXmlSource, tag: str, *, chunk_size: int = 8192) -> Iterator[ElementTree.Element]:
+    """Parses XML yielding the root element first and then every `tag` element.
+
+    Raw XML is parsed at once, since building the whole tree in C is the fastest.
+
+    A response is parsed incrementally yielding `tag` elements as soon as they are closed
+    and clearing them once processed. Cleared elements stay attached to the tree being built,
+    so memory usage still grows with the number of elements, though far slower than for whole elements.
+    Note that in this case the root element yielded has its tag and attributes, but no children.
+
+    :param source: Raw XML or a (streamed) response to read it from in chunks.
+        Response body is decoded (e.g. gunzipped) on the fly and the response is closed when done.
+    :param tag: Tag of the elements to yield.
+    :param chunk_size: Number of bytes to read from a response at once.
+
+    """
+    if isinstance(source, bytes):
+        root = ElementTree.fromstring(source)
+        yield root
+        yield from root.iter(tag)
+        return
+
+    try:
+        yield from _iter_xml_chunks(source.iter_content(chunk_size=chunk_size), tag)
+
+    finally:
+        # Release the connection back to the pool even if parsing stopped halfway.
+        source.close()
+
+
+def _iter_xml_chunks(chunks: Iterable[bytes], tag: str) -> Iterator[ElementTree.Element]:
+    """Incrementally parses XML from chunks. See iter_xml().
+
+    :param chunks:
+    :param tag:
+
+    """
+    # Subscribing to 'start' events for every element just to get the root
+    # makes parsing about twice as slow, so the root is taken with a separate
+    # parser which is only fed until the root is opened (usually the first chunk).
+    root_parser = ElementTree.XMLPullParser(events=('start',))
+    parser = ElementTree.XMLPullParser(events=('end',))
+    root = None
+
+    for chunk in chunks:
+
+        if root is None:
+            root_parser.feed(chunk)
+
+            for _, root in root_parser.read_events():
+                yield root
+                break
+
+        parser.feed(chunk)
+
+        for _, element in parser.read_events():
+            if element.tag == tag:
+                yield element
+                element.clear()
+
+    parser.close()  # Raises on incomplete or empty documents.
+
+    for _, element in parser.read_events():
+        if element.tag == tag:
+            yield element
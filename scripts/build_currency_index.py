@@ -0,0 +1,18 @@
+"""Builds prebuilt index for currencies data bundled with the package.
+
+Should be run every time DAILY_CURRENCIES or MONTHLY_CURRENCIES change:
+
+    python scripts/build_currency_index.py
+
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pycbrf.rates.currencies import Currencies, PATH_PREBUILT_INDEX  # noqa: E402
+
+
+if __name__ == '__main__':
+    Currencies().dump_bundled()
+    print(f'Written: {PATH_PREBUILT_INDEX}')
@@ -6,6 +6,8 @@ from setuptools import setup, find_packages
 
 PATH_BASE = os.path.dirname(__file__)
 
+RE_VERSION = re.compile(r'VERSION\s*=\s*\(([^)]+)\)')
+
 
 def read_file(fpath):
     """Reads a file within package directories."""
@@ -17,9 +19,8 @@ def get_version():
     """Returns version number, without module import (which can lead to ImportError
     if some dependencies are unavailable before install."""
     contents = read_file(os.path.join('pycbrf', '__init__.py'))
-    version = re.search('VERSION = \(([^)]+)\)', contents)
-    version = version.group(1).replace(', ', '.').strip()
-    return version
+    version = RE_VERSION.search(contents).group(1)
+    return '.'.join(part.strip() for part in version.split(','))
 
 
 setup(
@@ -0,0 +1,61 @@
+import datetime as dt
+
+import pytest
+
+from pycbrf import Currencies, ExchangeRates, ExchangeRateDynamics
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--run-network', action='store_true', default=False,
+        help='Run tests marked with `network` (they query www.cbr.ru live).')
+
+
+def pytest_collection_modifyitems(config, items):
+
+    if config.getoption('--run-network'):
+        return
+
+    skip_network = pytest.mark.skip(reason='needs --run-network option to run')
+
+    for item in items:
+        if 'network' in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture
+def assert_fields():
+    # Checks object attributes: assert_fields(rate, code='USD', par=Decimal(1))
+
+    def assert_fields_(obj, **expected):
+        for field, value in expected.items():
+            assert getattr(obj, field) == value, field
+
+    return assert_fields_
+
+
+@pytest.fixture
+def today():
+    # Evaluated per test rather than at collection, so that it matches
+    # the date the library sees even if the run spans midnight.
+    return dt.datetime.combine(dt.date.today(), dt.time())
+
+
+@pytest.fixture
+def recorded_rates(monkeypatch, datafix_readbin):
+    # Serves rates requests with responses from datafixtures/ trimmed to the currencies tests check,
+    # e.g. daily_20210824.xml or dynamic_R01239_20210824_20210824.xml.
+
+    # Keep currencies registered from old rates from leaking into other tests.
+    lib = Currencies()
+    monkeypatch.setattr(lib, 'currencies', dict(lib.currencies))
+
+    monkeypatch.setattr(
+        ExchangeRates, '_get_data',
+        staticmethod(lambda on_date, *, locale_en: datafix_readbin(
+            f"daily{'_eng' if locale_en else ''}_{on_date:%Y%m%d}.xml")))
+
+    monkeypatch.setattr(
+        ExchangeRateDynamics, '_get_data',
+        staticmethod(lambda currency, since, till: datafix_readbin(
+            f'dynamic_{currency.id}_{since:%Y%m%d}_{till:%Y%m%d}.xml')))
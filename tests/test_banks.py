@@ -5,12 +5,16 @@ import pytest
 from pycbrf import Banks
 
 
+@pytest.mark.network
 @pytest.mark.xfail
 def test_get_archive():
     assert Banks._get_data_swift()
 
 
-@pytest.mark.parametrize('legacy', [True, False])
+@pytest.mark.parametrize('legacy', [
+    pytest.param(True, marks=pytest.mark.network),  # SWIFT codes are always downloaded.
+    False,
+])
 def test_banks(legacy, monkeypatch, datafix_readbin):
 
     @classmethod  # hack
@@ -0,0 +1,96 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from pycbrf import ExchangeRates, ExchangeRateDynamics, Currencies, cache, utils
+from pycbrf.exceptions import WrongResponse
+
+
+def test_get_or_fetch(monkeypatch, tmp_path):
+
+    fetched = []
+
+    def fetch():
+        fetched.append(1)
+        return b'<ValCurs/>'
+
+    # Disabled.
+    monkeypatch.delenv(cache.ENV_CACHE_DIR, raising=False)
+    assert cache.get_or_fetch('some', fetch) == b'<ValCurs/>'
+    assert cache.get_or_fetch('some', fetch) == b'<ValCurs/>'
+    assert len(fetched) == 2
+
+    # Enabled.
+    fetched.clear()
+    monkeypatch.setenv(cache.ENV_CACHE_DIR, str(tmp_path))
+    assert cache.get_or_fetch('some', fetch) == b'<ValCurs/>'
+    assert cache.get_or_fetch('some', fetch) == b'<ValCurs/>'
+    assert len(fetched) == 1
+
+    # Stale.
+    assert cache.get_or_fetch('some', fetch, ttl=-1) == b'<ValCurs/>'
+    assert len(fetched) == 2
+
+
+def test_get_cached(monkeypatch, tmp_path):
+    class Response:
+
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            pass
+
+    bodies = []
+
+    @classmethod
+    def get_response(cls, url, **kwargs):
+        return Response(bodies.pop(0))
+
+    monkeypatch.setattr(utils.WithRequests, '_get_response', get_response)
+    monkeypatch.setenv(cache.ENV_CACHE_DIR, str(tmp_path))
+
+    stored = []
+    get_or_fetch = cache.get_or_fetch
+
+    def get_or_fetch_(key, fetch, *, ttl=None):
+        stored.append((key, ttl))
+        return get_or_fetch(key, fetch, ttl=ttl)
+
+    monkeypatch.setattr(utils, 'get_or_fetch', get_or_fetch_)
+
+    valcurs = b'<ValCurs Date="21.08.2021"/>'
+    today = datetime.combine(date.today(), datetime.min.time())
+    past = datetime(2021, 8, 21)
+
+    # Error pages are not cached.
+    for body in (b'Error in parameters', b'<html></html>'):
+        bodies.append(body)
+        with pytest.raises(WrongResponse):
+            ExchangeRates._get_data(past, locale_en=True)
+
+    bodies.append(valcurs)
+    assert ExchangeRates._get_data(past, locale_en=True) == valcurs
+    assert ExchangeRates._get_data(past, locale_en=True) == valcurs  # From cache.
+    assert not bodies
+
+    bodies.append(valcurs)
+    ExchangeRates._get_data(today, locale_en=False)
+
+    dynamics = ExchangeRateDynamics.__new__(ExchangeRateDynamics)
+    usd = Currencies()['USD']
+
+    bodies.append(valcurs)
+    dynamics._get_data(usd, past - timedelta(days=7), past)
+    bodies.append(valcurs)
+    dynamics._get_data(usd, past, today)
+
+    assert stored == [
+        ('daily:1:20210821', None),
+        ('daily:1:20210821', None),
+        ('daily:1:20210821', None),
+        ('daily:1:20210821', None),
+        (f'daily:0:{today:%Y%m%d}', utils.CACHE_TTL_RECENT),
+        ('dynamic:R01235:20210814:20210821', None),
+        (f'dynamic:R01235:20210821:{today:%Y%m%d}', utils.CACHE_TTL_RECENT),
+    ]
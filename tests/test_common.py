@@ -3,3 +3,31 @@ def test_toolbox():
     # import test
     from pycbrf.toolbox import Currencies
 
+
+def test_iter_xml():
+    from pycbrf.utils import iter_xml
+
+    xml = (
+        b'<?xml version="1.0"?>'
+        b'<ValCurs Date="25.06.2016"><Valute ID="a"><Value>1</Value></Valute><Valute ID="b"/></ValCurs>'
+    )
+
+    class Response:
+        closed = False
+
+        def iter_content(self, chunk_size):
+            # Tiny chunks split tags, including the root one.
+            return (xml[i:i + 7] for i in range(0, len(xml), 7))
+
+        def close(self):
+            self.closed = True
+
+    response = Response()
+
+    for source in (xml, response):
+        elements = iter_xml(source, 'Valute')
+        root = next(elements)
+        assert (root.tag, root.attrib) == ('ValCurs', {'Date': '25.06.2016'})
+        assert [element.attrib['ID'] for element in elements] == ['a', 'b']
+
+    assert response.closed
@@ -3,13 +3,12 @@ from decimal import Decimal
 
 import pytest
 
-from pycbrf import ExchangeRates, Currencies, Currency
+from pycbrf import ExchangeRates, Currencies, Currency, cache
 from pycbrf.exceptions import CurrencyNotFound
+from pycbrf.rates.constants import DAILY_CURRENCIES, MONTHLY_CURRENCIES
 
-today = dt.datetime.combine(dt.date.today(), dt.time())
 
-
-def test_currencies():
+def test_currencies(recorded_rates, assert_fields):
     lib = Currencies()
     aud = Currency(
         id='R01010',
@@ -38,20 +37,8 @@ def test_currencies():
         lib['None']
     assert e.value.message == 'There is no such currency within Currencies.'
 
-    assert lib['aud'] == aud
-    assert lib['AUD'] == aud
-    assert lib['R01010'] == aud
-    assert lib['r01010'] == aud
-    assert lib['036'] == aud
-    assert lib['36'] == aud
-    assert lib[36] == aud
-
-    assert lib['kpw'].id == 'R01145'
-    assert lib['KPW'].name_ru == 'Вона КНДР'
-    assert lib['R01145'].name_eng == 'North Korean Won'
-    assert lib['r01145'].num == '408'
-    assert lib['408'].code == 'KPW'
-    assert lib[408].par == Decimal(100)
+    for key in ('aud', 'AUD', 'R01010', 'r01010', '036', '36', 36):
+        assert lib[key] == aud, key
 
     """test to add a new Currency to the Library"""
     fer = Currency(
@@ -64,12 +51,36 @@ def test_currencies():
     )
     lib.register(fer)
 
-    assert lib['fer'].id == 'R99999'
-    assert lib['FER'].name_ru == 'Лунный фертинг'
-    assert lib['R99999'].name_eng == 'Lunar ferting'
-    assert lib['r99999'].num == '999'
-    assert lib['999'].code == 'FER'
-    assert lib[999].par == Decimal(1000)
+    for key in ('fer', 'FER', 'R99999', 'r99999', '999', 999):
+        assert lib[key] is fer, key
+
+    # test with a very old date with a currency that is not in the Currencies
+    # added by ExchangeRates automatically
+
+    """Raising exceptions is disabled for backward compatibility."""
+    with pytest.raises(CurrencyNotFound) as e:
+        lib['BYR']
+    assert e.value.message == 'There is no such currency within Currencies.'
+
+    rates = ExchangeRates('2016-06-26', locale_en=True)
+
+    byr = rates['BYR']
+
+    for key in ('byr', 'R01090', 'r01090', '974', 974):
+        assert rates[key] is byr, key
+
+    assert_fields(
+        byr,
+        id='R01090', num='974', code='BYR', name='Belarussian Ruble',
+        par=Decimal(10000), value=Decimal('32.6582'), rate=Decimal('0.00326582'))
+    assert_fields(byr.currency, name_ru='Belarussian Ruble')
+
+
+@pytest.mark.network
+def test_currencies_update(monkeypatch):
+    lib = Currencies()
+    monkeypatch.setattr(lib, 'updated', None)
+    monkeypatch.setattr(lib, 'currencies', dict(lib.currencies))
 
     # test to CurrenicesLib.update()
     lib.update()
@@ -79,21 +90,65 @@ def test_currencies():
     lib.update()
     assert lib.updated > post_date
 
-    # test with a very old date with a currency that is not in the Currencies
-    # added by ExchangeRates automatically
 
-    """Raising exceptions is disabled for backward compatibility."""
-    with pytest.raises(CurrencyNotFound) as e:
-        lib['BYR']
-    assert e.value.message == 'There is no such currency within Currencies.'
+@pytest.mark.parametrize('key, attr, expected', [
+    ('kpw', 'id', 'R01145'),
+    ('KPW', 'name_ru', 'Вона КНДР'),
+    ('R01145', 'name_eng', 'North Korean Won'),
+    ('r01145', 'num', '408'),
+    ('408', 'code', 'KPW'),
+    (408, 'par', Decimal(100)),
+])
+def test_currencies_lookup(key, attr, expected, assert_fields):
+    assert_fields(Currencies()[key], **{attr: expected})
 
-    rates = ExchangeRates('2016-06-26', locale_en=True)
 
-    assert rates['BYR'].id == 'R01090'
-    assert rates['byr'].currency.name_ru == 'Belarussian Ruble'
-    assert rates['R01090'].name == 'Belarussian Ruble'
-    assert rates['r01090'].num == '974'
-    assert rates['974'].code == 'BYR'
-    assert rates[974].par == Decimal(10000)
-    assert rates['BYR'].value == Decimal('32.6582')
-    assert rates['BYR'].rate == Decimal('0.00326582')
+def test_currencies_unhashable():
+    with pytest.raises(CurrencyNotFound):
+        Currencies()[['USD']]
+
+
+def test_currencies_cache(monkeypatch, tmp_path):
+    calls = []
+
+    class Response:
+
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            pass
+
+    @classmethod
+    def get_response(cls, url, **kwargs):
+        calls.append(kwargs.get('params'))
+        return Response(MONTHLY_CURRENCIES if kwargs.get('params') else DAILY_CURRENCIES)
+
+    monkeypatch.setattr(Currencies, '_get_response', get_response)
+
+    # Keep the shared instance state from leaking into other tests.
+    lib = Currencies()
+    monkeypatch.setattr(lib, 'updated', None)
+    monkeypatch.setattr(lib, 'currencies', dict(lib.currencies))
+
+    # Not cached by default.
+    monkeypatch.delenv(cache.ENV_CACHE_DIR, raising=False)
+    lib.update()
+    lib.update()
+    assert len(calls) == 4
+
+    # Opt-in on-disk cache.
+    calls.clear()
+    monkeypatch.setenv(cache.ENV_CACHE_DIR, str(tmp_path))
+    lib.update()
+    lib.update()
+    assert len(calls) == 2
+
+    assert lib['kpw'].name_ru == 'Вона КНДР'
+    assert lib[408].par == Decimal(100)
+
+
+def test_currencies_prebuilt():
+    lib = Currencies()
+    # Prebuilt index must be rebuilt with scripts/build_currency_index.py when bundled data changes.
+    assert lib._load_bundled() == lib._parse((DAILY_CURRENCIES, MONTHLY_CURRENCIES))
@@ -3,10 +3,8 @@ from decimal import Decimal
 
 import pytest
 
-from pycbrf import ExchangeRateDynamics
-from pycbrf.exceptions import WrongArguments, ExchangeRateNotFound
-
-today = dt.datetime.combine(dt.date.today(), dt.time())
+from pycbrf import ExchangeRateDynamics, Currencies
+from pycbrf.exceptions import WrongArguments, ExchangeRateNotFound, WrongResponse
 
 
 def test_exchange_rate_dynamics_wrong_args():
@@ -18,9 +16,17 @@ def test_exchange_rate_dynamics_wrong_args():
     pytest.raises(WrongArguments, ExchangeRateDynamics, '2021-08-24', '2021-08-22', currency='')
     # currency is None
     pytest.raises(WrongArguments, ExchangeRateDynamics, '2021-08-24', '2021-08-22', currency=None)
+    # period chunk is shorter than a day
+    pytest.raises(
+        WrongArguments, ExchangeRateDynamics, '2021-08-01', '2021-08-24', currency='USD', chunk=dt.timedelta(hours=1))
+    # period chunk is not a whole number of days
+    pytest.raises(
+        WrongArguments, ExchangeRateDynamics, '2021-08-01', '2021-08-24', currency='USD',
+        chunk=dt.timedelta(days=1, hours=1))
 
 
-def test_exchange_rate_dynamics():
+@pytest.mark.network
+def test_exchange_rate_dynamics_today(today):
     # test with currency without dates, for today
     rates = ExchangeRateDynamics(currency='USD')
 
@@ -28,53 +34,59 @@ def test_exchange_rate_dynamics():
     assert rates.since == today
     assert len(rates) in (0, 1)
 
+
+def test_exchange_rate_dynamics(today, recorded_rates, assert_fields):
     # test with specific date
     date_check = dt.datetime(year=2021, month=8, day=24)
     rates = ExchangeRateDynamics(date_check, currency='EUR')
 
     assert len(rates) == 1
-    assert rates[date_check].id == 'R01239'
-    assert rates[date_check.date()].name == 'Евро'
-    assert rates['2021-08-24'].currency.name_eng == 'Euro'
-    assert rates['2021-08-24'].num == '978'
-    assert rates['2021-08-24'].code == 'EUR'
-    assert rates['2021-08-24'].par == Decimal(1)
-    assert rates['2021-08-24'].value == Decimal('86.7838')
-    assert rates['2021-08-24'].rate == Decimal('86.7838')
+
+    rate = rates['2021-08-24']
+    assert rates[date_check] is rate
+    assert rates[date_check.date()] is rate
+    assert_fields(rate.currency, name_eng='Euro')
+    assert_fields(
+        rate,
+        id='R01239', name='Евро', num='978', code='EUR',
+        par=Decimal(1), value=Decimal('86.7838'), rate=Decimal('86.7838'),
+    )
 
     # test with a period of one day
     rates = ExchangeRateDynamics('2021-08-10', '2021-08-10', currency='R01215')
-    date_check = dt.datetime(2021, 8, 10)
+    date_check = dt.date(2021, 8, 10)
     datetime_check = dt.datetime(2021, 8, 10)
 
     assert len(rates) == 1
-    assert rates['2021-08-10'].id == 'R01215'
-    assert rates[date_check].name == 'Датская крона'
-    assert rates[datetime_check].currency.name_eng == 'Danish Krone'
-    assert rates['2021-08-10'].num == '208'
-    assert rates['2021-08-10'].code == 'DKK'
-    assert rates['2021-08-10'].par == Decimal(1)
-    assert rates['2021-08-10'].value == Decimal('11.6245')
-    assert rates['2021-08-10'].rate == Decimal('11.6245')
+
+    rate = rates['2021-08-10']
+    assert rates[date_check] is rate
+    assert rates[datetime_check] is rate
+    assert_fields(rate.currency, name_eng='Danish Krone')
+    assert_fields(
+        rate,
+        id='R01215', name='Датская крона', num='208', code='DKK',
+        par=Decimal(1), value=Decimal('11.6245'), rate=Decimal('11.6245'),
+    )
 
     # this is represents problem of nominals between rate and currency
     # That is the problem of the Bank of Russia library.
     # It does not affect the rate, just need to know about it
-    assert rates['2021-08-10'].currency.par == Decimal(10)
+    assert rate.currency.par == Decimal(10)
 
     # test period of rates
     rates = ExchangeRateDynamics('2021-08-01', '2021-08-24', currency=203)
 
-    assert len(rates) == 16
-    assert rates['2021-08-10'].currency.id == 'R01760'
-    assert rates[date_check].currency.name_ru == 'Чешская крона'
-    assert rates[datetime_check].currency.name_eng == 'Czech Koruna'
-    assert rates['2021-08-10'].currency.num == '203'
-    assert rates['2021-08-10'].currency.code == 'CZK'
-    assert rates['2021-08-10'].currency.par == Decimal(10)
-    assert rates['2021-08-10'].par == Decimal(10)
-    assert rates['2021-08-10'].value == Decimal('34.0109')
-    assert rates['2021-08-10'].rate == Decimal('3.40109')
+    assert len(rates) == 1  # Recorded response is trimmed.
+
+    rate = rates['2021-08-10']
+    assert rates[date_check] is rate
+    assert rates[datetime_check] is rate
+
+    assert_fields(
+        rate.currency,
+        id='R01760', name_ru='Чешская крона', name_eng='Czech Koruna', num='203', code='CZK', par=Decimal(10))
+    assert_fields(rate, par=Decimal(10), value=Decimal('34.0109'), rate=Decimal('3.40109'))
 
     # test with a date without rates
     rates = ExchangeRateDynamics('2021-08-01', '2021-08-24', currency='R01750')
@@ -92,3 +104,72 @@ def test_exchange_rate_dynamics():
     with pytest.raises(ExchangeRateNotFound) as e:
         assert rates['2021-08-24']
     assert e.value.message == 'There is no such ExchangeRate within ExchangeRates.'
+
+
+def test_exchange_rate_dynamics_parse():
+    currency = Currencies()['USD']
+
+    rates = ExchangeRateDynamics._parse(
+        b'<?xml version="1.0" encoding="windows-1251"?>'
+        b'<ValCurs ID="R01235" DateRange1="01.08.2021" DateRange2="01.08.2021" name="Foreign Currency Market Dynamic">'
+        b'</ValCurs>',
+        currency
+    )
+    assert rates == {}
+
+    with pytest.raises(WrongResponse):
+        ExchangeRateDynamics._parse(b'Error in parameters', currency)
+
+    with pytest.raises(WrongResponse):
+        ExchangeRateDynamics._parse(b'<html></html>', currency)
+
+
+@pytest.mark.parametrize('days', [1, 2, 5, 7, 24, 30])
+def test_exchange_rate_dynamics_chunks(monkeypatch, days):
+    periods = []
+
+    def get_data(currency, since, till):
+        periods.append((since, till))
+        records = ''.join(
+            f'<Record Date="{since + dt.timedelta(days=shift):%d.%m.%Y}" Id="{currency.id}">'
+            '<Nominal>1</Nominal><Value>73,0000</Value></Record>'
+            for shift in range((till - since).days + 1))
+        return f'<ValCurs ID="{currency.id}">{records}</ValCurs>'.encode()
+
+    monkeypatch.setattr(ExchangeRateDynamics, '_get_data', staticmethod(get_data))
+
+    rates = ExchangeRateDynamics('2021-08-01', '2021-08-24', currency='USD', chunk=dt.timedelta(days=days))
+
+    # Chunks cover the period exactly: no gaps, no overlaps.
+    periods.sort()
+    assert periods[0][0] == dt.datetime(2021, 8, 1)
+    assert periods[-1][1] == dt.datetime(2021, 8, 24)
+    for (_, till), (since, _) in zip(periods, periods[1:]):
+        assert since == till + dt.timedelta(days=1)
+
+    assert len(periods) == -(-24 // days)
+    assert sorted(rates.rates) == [dt.datetime(2021, 8, day) for day in range(1, 25)]
+
+
+def test_exchange_rate_dynamics_bulk(monkeypatch, assert_fields):
+    fetched = []
+
+    def get_data(currency, since, till):
+        fetched.append(currency.code)
+        return (
+            f'<ValCurs ID="{currency.id}">'
+            f'<Record Date="{since:%d.%m.%Y}" Id="{currency.id}"><Nominal>1</Nominal><Value>73,0000</Value></Record>'
+            '</ValCurs>').encode()
+
+    monkeypatch.setattr(ExchangeRateDynamics, '_get_data', staticmethod(get_data))
+
+    currencies = Currencies()
+    usd, eur = currencies['USD'], currencies['EUR']
+
+    dynamics = ExchangeRateDynamics.bulk('2021-08-24', '2021-08-24', currencies=['USD', 840, eur])
+
+    # USD and 840 refer to the same currency, hence fetched once.
+    assert sorted(fetched) == ['EUR', 'USD']
+    assert set(dynamics) == {usd, eur}
+    assert dynamics[usd].currency is usd
+    assert_fields(dynamics[eur]['2021-08-24'], code='EUR', value=Decimal('73.0000'))
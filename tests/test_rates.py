@@ -1,103 +1,145 @@
+from datetime import datetime
 from decimal import Decimal
 
+import pytest
+
 from pycbrf import ExchangeRates
 
 
-def test_rates():
+def test_rates(recorded_rates, assert_fields):
     rates = ExchangeRates('2016-06-26', locale_en=True)
 
-    assert str(rates.date_requested) == '2016-06-26 00:00:00'
-    assert str(rates.date_received) == '2016-06-25 00:00:00'
-    assert not rates.dates_match
+    assert_fields(
+        rates,
+        date_requested=datetime(2016, 6, 26), date_received=datetime(2016, 6, 25), dates_match=False)
 
     assert rates['dummy'] is None
     assert rates[''] is None
     assert rates[None] is None
-    assert rates['USD'].name == 'US Dollar'
-    assert rates['R01235'].name == 'US Dollar'
-    assert rates['840'].name == 'US Dollar'
+
+    for key in ('USD', 'R01235', '840'):
+        assert rates[key].name == 'US Dollar', key
 
     rates = ExchangeRates('2016-06-25')
 
-    assert str(rates.date_requested) == '2016-06-25 00:00:00'
-    assert str(rates.date_received) == '2016-06-25 00:00:00'
-    assert rates.dates_match
+    assert_fields(
+        rates,
+        date_requested=datetime(2016, 6, 25), date_received=datetime(2016, 6, 25), dates_match=True)
 
-    assert rates['USD'].name == 'Доллар США'
-    assert rates['R01235'].name == 'Доллар США'
-    assert rates['840'].name == 'Доллар США'
+    for key in ('USD', 'R01235', '840'):
+        assert rates[key].name == 'Доллар США', key
 
 
-def test_exchange_rates_extra():
+@pytest.mark.network
+def test_exchange_rates_today(assert_fields):
     # test without date, for today
     rates = ExchangeRates()
 
     assert len(rates) > 0
-    a = rates['USD']
-    a = 1
-
-    assert rates['eur'].id == 'R01239'
-    assert rates['EUR'].currency.name_ru == 'Евро'
-    assert rates['R01239'].name == 'Евро'
-    assert rates['r01239'].num == '978'
-    assert rates['978'].code == 'EUR'
-    assert rates[978].par == Decimal(1)
-
-    assert rates['usd'].currency.id == 'R01235'
-    assert rates['USD'].currency.name_ru == 'Доллар США'
-    assert rates['R01235'].currency.name_eng == 'US Dollar'
-    assert rates['r01235'].currency.num == '840'
-    assert rates['840'].currency.code == 'USD'
-    assert rates[840].currency.par == Decimal(1)
 
+    eur = rates['EUR']
+    for key in ('eur', 'R01239', 'r01239', '978', 978):
+        assert rates[key] is eur, key
+
+    assert_fields(eur, id='R01239', name='Евро', num='978', code='EUR', par=Decimal(1))
+    assert_fields(eur.currency, name_ru='Евро')
+
+    usd = rates['USD']
+    for key in ('usd', 'R01235', 'r01235', '840', 840):
+        assert rates[key] is usd, key
+
+    assert_fields(
+        usd.currency,
+        id='R01235', name_ru='Доллар США', name_eng='US Dollar', num='840', code='USD', par=Decimal(1))
+
+
+def test_exchange_rates_extra(recorded_rates, assert_fields):
     # test with a request date different from the response date
     rates = ExchangeRates('2021-08-22')
-    assert len(rates) == 34
-
-    assert str(rates.date_requested) == '2021-08-22 00:00:00'
-    assert str(rates.date_received) == '2021-08-21 00:00:00'
-    assert not rates.dates_match
-
-    assert rates['cad'].currency.id == 'R01350'
-    assert rates['CAD'].currency.name_ru == 'Канадский доллар'
-    assert rates['R01350'].currency.name_eng == 'Canadian Dollar'
-    assert rates['r01350'].currency.num == '124'
-    assert rates['124'].currency.code == 'CAD'
-    assert rates[124].currency.par == Decimal(1)
-    assert rates['CAD'].value == Decimal('57.5885')
-    assert rates['CAD'].rate == Decimal('57.5885')
-
-    assert rates['usd'].id == 'R01235'
-    assert rates['USD'].name == 'Доллар США'
-    assert rates['R01235'].currency.name_eng == 'US Dollar'
-    assert rates['r01235'].num == '840'
-    assert rates['840'].code == 'USD'
-    assert rates[840].par == Decimal(1)
-    assert rates['USD'].value == Decimal('74.3640')
-    assert rates['USD'].rate == Decimal('74.3640')
+    assert len(rates) == 2  # Recorded response is trimmed.
+
+    assert_fields(
+        rates,
+        date_requested=datetime(2021, 8, 22), date_received=datetime(2021, 8, 21), dates_match=False)
+
+    cad = rates['CAD']
+    for key in ('cad', 'R01350', 'r01350', '124', 124):
+        assert rates[key] is cad, key
+
+    assert_fields(cad, value=Decimal('57.5885'), rate=Decimal('57.5885'))
+    assert_fields(
+        cad.currency,
+        id='R01350', name_ru='Канадский доллар', name_eng='Canadian Dollar', num='124', code='CAD', par=Decimal(1))
+
+    usd = rates['USD']
+    for key in ('usd', 'R01235', 'r01235', '840', 840):
+        assert rates[key] is usd, key
+
+    assert_fields(
+        usd,
+        id='R01235', name='Доллар США', num='840', code='USD',
+        par=Decimal(1), value=Decimal('74.3640'), rate=Decimal('74.3640'))
+    assert_fields(usd.currency, name_eng='US Dollar')
 
     # test with the request date matching the response date
     rates = ExchangeRates('2021-08-24')
-    assert len(rates) == 34
-
-    assert str(rates.date_requested) == '2021-08-24 00:00:00'
-    assert str(rates.date_received) == '2021-08-24 00:00:00'
-    assert rates.dates_match
-
-    assert rates['kzt'].currency.id == 'R01335'
-    assert rates['KZT'].currency.name_ru == 'Казахстанский тенге'
-    assert rates['R01335'].currency.name_eng == 'Kazakhstan Tenge'
-    assert rates['r01335'].currency.num == '398'
-    assert rates['398'].currency.code == 'KZT'
-    assert rates[398].currency.par == Decimal(100)
-    assert rates['KZT'].value == Decimal('17.3926')
-    assert rates['KZT'].rate == Decimal('0.173926')
-
-    assert rates['mdl'].id == 'R01500'
-    assert rates['MDL'].name == 'Молдавский лей'
-    assert rates['R01500'].currency.name_eng == 'Moldova Lei'
-    assert rates['r01500'].num == '498'
-    assert rates['498'].code == 'MDL'
-    assert rates[498].par == Decimal(10)
-    assert rates['MDL'].value == Decimal('41.9277')
-    assert rates['MDL'].rate == Decimal('4.19277')
+    assert len(rates) == 2  # Recorded response is trimmed.
+
+    assert_fields(
+        rates,
+        date_requested=datetime(2021, 8, 24), date_received=datetime(2021, 8, 24), dates_match=True)
+
+    kzt = rates['KZT']
+    for key in ('kzt', 'R01335', 'r01335', '398', 398):
+        assert rates[key] is kzt, key
+
+    assert_fields(kzt, value=Decimal('17.3926'), rate=Decimal('0.173926'))
+    assert_fields(
+        kzt.currency,
+        id='R01335', name_ru='Казахстанский тенге', name_eng='Kazakhstan Tenge', num='398', code='KZT',
+        par=Decimal(100))
+
+    mdl = rates['MDL']
+    for key in ('mdl', 'R01500', 'r01500', '498', 498):
+        assert rates[key] is mdl, key
+
+    assert_fields(
+        mdl,
+        id='R01500', name='Молдавский лей', num='498', code='MDL',
+        par=Decimal(10), value=Decimal('41.9277'), rate=Decimal('4.19277'))
+    assert_fields(mdl.currency, name_eng='Moldova Lei')
+
+
+def test_rates_fetch_many(monkeypatch, assert_fields):
+
+    def get_data(on_date, *, locale_en):
+        return (
+            f'<ValCurs Date="{on_date:%d.%m.%Y}" name="Foreign Currency Market">'
+            '<Valute ID="R01235"><NumCode>840</NumCode><CharCode>USD</CharCode><Nominal>1</Nominal>'
+            '<Name>US Dollar</Name><Value>73,3155</Value></Valute>'
+            '</ValCurs>'
+        ).encode()
+
+    monkeypatch.setattr(ExchangeRates, '_get_data', staticmethod(get_data))
+
+    rates = ExchangeRates.fetch_many(['2021-08-23', '2021-08-24'], locale_en=True)
+
+    assert len(rates) == 2
+    assert_fields(rates[datetime(2021, 8, 24)]['USD'], value=Decimal('73.3155'), date=datetime(2021, 8, 24))
+
+
+def test_rates_offline(recorded_rates, assert_fields):
+    rates = ExchangeRates('2016-06-26', locale_en=True)
+
+    assert_fields(rates, date_received=datetime(2016, 6, 25), dates_match=False)
+    assert len(rates) == 2
+    assert rates[['BYR']] is None
+
+    byr = rates['BYR']
+    for key in ('byr', '974', 974):
+        assert rates[key] is byr, key
+
+    assert_fields(
+        byr,
+        id='R01090', code='BYR', par=Decimal(10000), value=Decimal('32.6582'), rate=Decimal('0.00326582'))
+    assert_fields(byr.currency, name_ru='Belarussian Ruble')